@@ -1,16 +1,162 @@
+import array
+import atexit
+import bisect
+import collections
 import logging
+import logging.handlers
+import os
+import queue
+import statistics
+import sys
+import time
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("hospital_management.log"),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+logger = logging.getLogger(__name__)
+
+# Set by configure_logging(); nothing is opened or started at import time.
+_log_listener = None
+
+# Hospitals that record events, so buffered events still reach the log when
+# the interpreter exits without a final flush_events() call.
+_event_buffers = weakref.WeakSet()
+
+
+def _flush_event_buffers():
+    """Flushes the event buffer of every live Hospital."""
+    for hospital in list(_event_buffers):
+        hospital.flush_events()
+
+
+atexit.register(_flush_event_buffers)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to the stream's own buffer.
+
+    logging.StreamHandler flushes after every record, which turns each log call
+    into a write syscall. This handler only flushes for records at ERROR or above,
+    so routine records are written out in buffer-sized chunks.
+    """
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time part of asctime once per second.
+
+    Records logged within the same second reuse the cached strftime() result and
+    only append their milliseconds. Output is identical to logging.Formatter.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, cached_text)
+        return self.default_msec_format % (cached_text, record.msecs)
+
+
+def configure_logging(path="hospital_management.log"):
+    """
+    Sets up logging to a file and, for interactive runs, the console.
+
+    Log calls only enqueue the record; a background thread does the file and
+    console I/O so hospital operations never block on it. Calling this again
+    after logging is configured has no effect.
+
+    Args:
+        path (str): The log file to append to.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    # The log format never uses these LogRecord fields, so skip collecting them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
+    log_formatter = CachedTimeFormatter(LOG_FORMAT)
+
+    log_file = open(path, "a", buffering=64 * 1024)
+    atexit.register(log_file.flush)
+    file_handler = BufferedStreamHandler(log_file)
+    file_handler.setFormatter(log_formatter)
+
+    log_handlers = [file_handler]
+    # Echo to the console only for interactive runs; any HOSPITAL_QUIET value
+    # other than empty or "0" turns it off.
+    if sys.stderr.isatty() and os.environ.get("HOSPITAL_QUIET", "") in ("", "0"):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(log_formatter)
+        log_handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+    _log_listener.start()
+    # atexit runs handlers in reverse order, so this flush lands in the queue
+    # before the listener stops.
+    atexit.register(_log_listener.stop)
+    atexit.register(_flush_event_buffers)
+
+
+def to_timestamp(date_time):
+    """
+    Converts a datetime to integer POSIX microseconds.
+
+    The whole seconds come from datetime.timestamp() on the microsecond-free
+    value, so no precision is lost to float rounding.
+
+    Args:
+        date_time (datetime): The datetime to convert.
+
+    Returns:
+        int: The number of microseconds since the epoch.
+    """
+    return int(date_time.replace(microsecond=0).timestamp()) * 1_000_000 + date_time.microsecond
+
+
+def duration_to_microseconds(duration_minutes):
+    """
+    Converts an appointment length in minutes to microseconds.
+
+    Doctor.conflicts_with() relies on appointments never overlapping, which only
+    holds if every appointment covers a non-empty interval.
+
+    Args:
+        duration_minutes (int): The length of the appointment in minutes.
+
+    Returns:
+        int: The length in microseconds.
+
+    Raises:
+        ValueError: If the duration is not a positive integer.
+    """
+    if duration_minutes.__class__ is not int or duration_minutes <= 0:
+        raise ValueError("Duration must be a positive integer number of minutes.")
+    return duration_minutes * 60_000_000
+
 
 # Custom Exception for Invalid Age
 class InvalidAgeError(Exception):
@@ -31,6 +177,8 @@ class Person(ABC):
         is_valid_age(age): Validates if the age is a positive integer.
         get_details(): Abstract method to get details of the person.
     """
+    __slots__ = ('name', 'age')
+
     def __init__(self, name, age):
         """
         Initializes a Person object.
@@ -42,7 +190,8 @@ class Person(ABC):
         Raises:
             InvalidAgeError: If the age is invalid.
         """
-        if not self.is_valid_age(age):
+        # Same check as is_valid_age(), inlined to skip the method call.
+        if age.__class__ is not int or age <= 0:
             raise InvalidAgeError("Age must be a positive integer.")
         self.name = name
         self.age = age
@@ -51,6 +200,7 @@ class Person(ABC):
     def is_valid_age(age):
         """
         Checks if the provided age is a positive integer.
+        Booleans are rejected even though bool subclasses int.
 
         Args:
             age (int): The age to check.
@@ -58,7 +208,7 @@ class Person(ABC):
         Returns:
             bool: True if the age is valid, False otherwise.
         """
-        return isinstance(age, int) and age > 0
+        return age.__class__ is int and age > 0
 
     @abstractmethod
     def get_details(self):
@@ -73,12 +223,16 @@ class Doctor(Person):
     Attributes:
         doctor_id (int): The ID of the doctor.
         specialization (str): The specialization of the doctor.
-        schedule (list): A list of appointments for the doctor.
+        schedule (list): A list of appointments for the doctor, sorted by date_time.
 
     Methods:
         display_schedule(): Displays the doctor's schedule.
+        conflicts_with(start_ts, end_ts): Finds an appointment overlapping a time interval.
+        find_conflict(date_time, duration_minutes): Finds an appointment overlapping the given slot.
         get_details(): Returns a string with the doctor's details.
     """
+    __slots__ = ('doctor_id', 'specialization', 'schedule', '_schedule_starts', '_details')
+
     def __init__(self, doctor_id, name, age, specialization):
         """
         Initializes a Doctor object.
@@ -91,20 +245,71 @@ class Doctor(Person):
         """
         super().__init__(name, age)
         self.doctor_id = doctor_id
-        self.specialization = specialization
+        # Specializations repeat across many doctors; share one string object per value.
+        self.specialization = sys.intern(specialization) if isinstance(specialization, str) else specialization
         self.schedule = []
+        # Start timestamps of the scheduled appointments, parallel to schedule.
+        self._schedule_starts = array.array('q')
+        # Details never change after construction, so format them only once.
+        self._details = f"Doctor[ID: {doctor_id}, Name: {name}, Specialization: {specialization}]"
 
     def display_schedule(self):
         """
         Displays the doctor's appointment schedule.
-        Logs each scheduled appointment.
+        Logs all scheduled appointments as a single record.
         """
-        logging.info(f"Displaying schedule for Dr. {self.name}.")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        lines = [f"Displaying schedule for Dr. {self.name}."]
         if not self.schedule:
-            logging.info(f"No appointments scheduled for Dr. {self.name}.")
+            lines.append(f"No appointments scheduled for Dr. {self.name}.")
         else:
-            for appointment in self.schedule:
-                logging.info(f"  {appointment}")
+            lines.extend(f"  {appointment}" for appointment in self.schedule)
+        logger.info("\n".join(lines))
+
+    def conflicts_with(self, start_ts, end_ts):
+        """
+        Finds a scheduled appointment that overlaps the interval [start_ts, end_ts).
+
+        Scheduled appointments never overlap each other, so the one starting last
+        before `end_ts` also ends last and is the only candidate to test.
+
+        Args:
+            start_ts (int): The start of the interval in POSIX microseconds.
+            end_ts (int): The end of the interval in POSIX microseconds.
+
+        Returns:
+            Appointment: The conflicting appointment, or None if the interval is free.
+        """
+        index = bisect.bisect_left(self._schedule_starts, end_ts) - 1
+        if index >= 0:
+            candidate = self.schedule[index]
+            if candidate.date_time_ts < end_ts and candidate._end_ts > start_ts:
+                return candidate
+        return None
+
+    def find_conflict(self, date_time, duration_minutes=30):
+        """
+        Finds a scheduled appointment that overlaps the given slot.
+
+        Args:
+            date_time (datetime): The start of the slot to check.
+            duration_minutes (int): The length of the slot in minutes.
+
+        Returns:
+            Appointment: The conflicting appointment, or None if the slot is free.
+
+        Raises:
+            ValueError: If the duration is not a positive integer.
+        """
+        start_ts = to_timestamp(date_time)
+        return self.conflicts_with(start_ts, start_ts + duration_to_microseconds(duration_minutes))
+
+    def _add_appointment(self, appointment):
+        """Inserts an appointment into the schedule, keeping it ordered by start time."""
+        index = bisect.bisect_right(self._schedule_starts, appointment.date_time_ts)
+        self._schedule_starts.insert(index, appointment.date_time_ts)
+        self.schedule.insert(index, appointment)
 
     def get_details(self):
         """
@@ -113,11 +318,10 @@ class Doctor(Person):
         Returns:
             str: A string representation of the doctor's details.
         """
-        return f"Doctor[ID: {self.doctor_id}, Name: {self.name}, Specialization: {self.specialization}]"
+        return self._details
 
-    def __str__(self):
-        """Returns the string representation of the doctor's details."""
-        return self.get_details()
+    # str() of a doctor is its cached details; share the accessor instead of a wrapper.
+    __str__ = get_details
 
 
 class Patient(Person):
@@ -131,6 +335,8 @@ class Patient(Person):
     Methods:
         get_details(): Returns a string with the patient's details.
     """
+    __slots__ = ('patient_id', 'ailment', '_details')
+
     def __init__(self, patient_id, name, age, ailment):
         """
         Initializes a Patient object.
@@ -143,7 +349,8 @@ class Patient(Person):
         """
         super().__init__(name, age)
         self.patient_id = patient_id
-        self.ailment = ailment
+        self.ailment = sys.intern(ailment) if isinstance(ailment, str) else ailment
+        self._details = f"Patient[ID: {patient_id}, Name: {name}, Ailment: {ailment}]"
 
     def get_details(self):
         """
@@ -152,11 +359,9 @@ class Patient(Person):
         Returns:
             str: A string representation of the patient's details.
         """
-        return f"Patient[ID: {self.patient_id}, Name: {self.name}, Ailment: {self.ailment}]"
+        return self._details
 
-    def __str__(self):
-        """Returns the string representation of the patient's details."""
-        return self.get_details()
+    __str__ = get_details
 
 
 class Appointment:
@@ -168,11 +373,15 @@ class Appointment:
         patient (Patient): The patient for the appointment.
         doctor (Doctor): The doctor for the appointment.
         date_time (datetime): The date and time of the appointment.
+        date_time_ts (int): The date and time as POSIX microseconds, for sorting and range queries.
+        duration_minutes (int): The length of the appointment in minutes.
 
     Methods:
         __str__(): Returns a string representation of the appointment.
     """
-    def __init__(self, appointment_id, patient, doctor, date_time):
+    __slots__ = ('appointment_id', 'patient', 'doctor', 'date_time', 'date_time_ts', 'duration_minutes', '_end_ts', '_details')
+
+    def __init__(self, appointment_id, patient, doctor, date_time, duration_minutes=30):
         """
         Initializes an Appointment object.
 
@@ -181,15 +390,25 @@ class Appointment:
             patient (Patient): The patient for the appointment.
             doctor (Doctor): The doctor for the appointment.
             date_time (datetime): The date and time of the appointment.
+            duration_minutes (int): The length of the appointment in minutes.
+
+        Raises:
+            ValueError: If the duration is not a positive integer.
         """
+        duration = duration_to_microseconds(duration_minutes)
         self.appointment_id = appointment_id
         self.patient = patient
         self.doctor = doctor
         self.date_time = date_time
+        self.duration_minutes = duration_minutes
+        # Sorting, conflict checks and range queries compare these ints, never datetimes.
+        self.date_time_ts = to_timestamp(date_time)
+        self._end_ts = self.date_time_ts + duration
+        self._details = f"Appointment[ID: {appointment_id}, Patient: {patient.name}, Doctor: {doctor.name}, Time: {date_time}]"
 
     def __str__(self):
         """Returns a string representation of the appointment."""
-        return f"Appointment[ID: {self.appointment_id}, Patient: {self.patient.name}, Doctor: {self.doctor.name}, Time: {self.date_time}]"
+        return self._details
 
 
 class Hospital:
@@ -201,26 +420,70 @@ class Hospital:
         doctors (dict): A dictionary of doctors indexed by their doctor_id.
         patients (dict): A dictionary of patients indexed by their patient_id.
         appointments (dict): A dictionary of appointments indexed by appointment_id.
+        quiet (bool): If True, routine events are discarded instead of buffered.
+        max_events (int): The number of buffered events that triggers an automatic flush.
 
     Methods:
         add_doctor(doctor): Adds a doctor to the hospital.
         add_patient(patient): Adds a patient to the hospital.
-        book_appointment(appointment_id, patient_id, doctor_id, date_time): Books an appointment for a patient with a doctor.
+        add_doctors(doctors): Adds several doctors with a single summary event.
+        add_patients(patients): Adds several patients with a single summary event.
+        book_appointment(appointment_id, patient_id, doctor_id, date_time, duration_minutes): Books an appointment for a patient with a doctor.
+        appointments_for_doctor(doctor_id): Returns the appointments booked with a doctor.
+        appointments_for_patient(patient_id): Returns the appointments booked for a patient.
+        average_patient_age(): Returns the mean age of all registered patients.
+        patients_aged_at_least(min_age): Returns the IDs of patients of at least the given age.
+        count_appointments_between(start, end): Counts appointments within a time window.
+        appointments_between(start, end): Returns the appointments within a time window.
+        flush_events(): Logs all buffered events as a single record.
         display_patients(): Displays all registered patients.
         display_doctors(): Displays all registered doctors.
         display_appointments(): Displays all scheduled appointments.
     """
-    def __init__(self, name):
+    __slots__ = (
+        'name', 'quiet', 'max_events', '_events',
+        'doctors', 'patients', 'appointments',
+        '_doctor_list', '_patient_list', '_appointment_list',
+        '_by_doctor', '_by_patient',
+        '_patient_ids', '_patient_ages', '_appointment_times', '_appointment_ids',
+        '__weakref__'
+    )
+
+    def __init__(self, name, quiet=False, max_events=1000):
         """
         Initializes a Hospital object.
 
         Args:
             name (str): The name of the hospital.
+            quiet (bool): If True, routine add/book events are not recorded.
+            max_events (int): The number of buffered events that triggers an automatic flush.
         """
         self.name = name
+        self.quiet = quiet
+        self.max_events = max_events
+        # Routine events are buffered as (format, args) pairs and written out by
+        # flush_events(), keeping log I/O off the add/book path during bulk loads.
+        self._events = []
+        if not quiet:
+            _event_buffers.add(self)
         self.doctors = {}
         self.patients = {}
         self.appointments = {}
+        # Registration-ordered lists for scans; the dicts above stay the lookup path.
+        self._doctor_list = []
+        self._patient_list = []
+        self._appointment_list = []
+        # Secondary indexes so per-doctor/per-patient lookups avoid scanning every appointment.
+        self._by_doctor = collections.defaultdict(list)
+        self._by_patient = collections.defaultdict(list)
+        # Column-wise copies of the fields used by patient analytics. Ages live
+        # in a contiguous int64 array; IDs can be any hashable, so they stay a list.
+        self._patient_ids = []
+        self._patient_ages = array.array('q')
+        # Appointment start timestamps in ascending order, with the
+        # matching appointment IDs at the same positions.
+        self._appointment_times = array.array('q')
+        self._appointment_ids = []
 
     def add_doctor(self, doctor):
         """
@@ -234,9 +497,11 @@ class Hospital:
         """
         if doctor.doctor_id not in self.doctors:
             self.doctors[doctor.doctor_id] = doctor
-            logging.info(f"Added Doctor: {doctor.name} ({doctor.specialization}).")
+            self._doctor_list.append(doctor)
+            self._record_event("Added Doctor: %s (%s).", (doctor.name, doctor.specialization))
         else:
-            logging.error(f"Doctor {doctor.name} is already registered.")
+            self.flush_events()
+            logger.error("Doctor %s is already registered.", doctor.name)
             raise ValueError(f"Doctor {doctor.name} is already registered.")
 
     def add_patient(self, patient):
@@ -250,13 +515,84 @@ class Hospital:
             ValueError: If the patient is already registered.
         """
         if patient.patient_id not in self.patients:
+            self._add_patient_columns(patient)
             self.patients[patient.patient_id] = patient
-            logging.info(f"Added Patient: {patient.name} (Ailment: {patient.ailment}).")
+            self._patient_list.append(patient)
+            self._record_event("Added Patient: %s (Ailment: %s).", (patient.name, patient.ailment))
         else:
-            logging.error(f"Patient {patient.name} is already registered.")
+            self.flush_events()
+            logger.error("Patient %s is already registered.", patient.name)
             raise ValueError(f"Patient {patient.name} is already registered.")
 
-    def book_appointment(self, appointment_id, patient_id, doctor_id, date_time):
+    def add_doctors(self, doctors):
+        """
+        Adds several doctors to the hospital, recording a single summary event.
+
+        Unlike add_doctor(), already registered doctors are skipped rather than
+        raising; they are reported together in one warning.
+
+        Args:
+            doctors (iterable): The doctors to add to the hospital.
+
+        Returns:
+            int: The number of doctors added.
+        """
+        registry = self.doctors
+        doctor_list = self._doctor_list
+        added = []
+        rejected = []
+        for doctor in doctors:
+            if doctor.doctor_id not in registry:
+                registry[doctor.doctor_id] = doctor
+                doctor_list.append(doctor)
+                added.append(doctor.name)
+            else:
+                rejected.append(doctor.name)
+        if added:
+            self._record_event("Added %d doctors: %s.", (len(added), ", ".join(added)))
+        if rejected:
+            self.flush_events()
+            logger.warning("Skipped %d already registered doctors: %s.", len(rejected), ", ".join(rejected))
+        return len(added)
+
+    def add_patients(self, patients):
+        """
+        Adds several patients to the hospital, recording a single summary event.
+
+        Unlike add_patient(), already registered patients are skipped rather than
+        raising; they are reported together in one warning.
+
+        Args:
+            patients (iterable): The patients to add to the hospital.
+
+        Returns:
+            int: The number of patients added.
+        """
+        registry = self.patients
+        patient_list = self._patient_list
+        added = []
+        rejected = []
+        for patient in patients:
+            if patient.patient_id not in registry:
+                self._add_patient_columns(patient)
+                registry[patient.patient_id] = patient
+                patient_list.append(patient)
+                added.append(patient.name)
+            else:
+                rejected.append(patient.name)
+        if added:
+            self._record_event("Added %d patients: %s.", (len(added), ", ".join(added)))
+        if rejected:
+            self.flush_events()
+            logger.warning("Skipped %d already registered patients: %s.", len(rejected), ", ".join(rejected))
+        return len(added)
+
+    def _add_patient_columns(self, patient):
+        """Appends a patient's analytics fields to the column arrays."""
+        self._patient_ages.append(patient.age)
+        self._patient_ids.append(patient.patient_id)
+
+    def book_appointment(self, appointment_id, patient_id, doctor_id, date_time, duration_minutes=30):
         """
         Books an appointment for a patient with a doctor.
 
@@ -265,46 +601,186 @@ class Hospital:
             patient_id (int): The ID of the patient.
             doctor_id (int): The ID of the doctor.
             date_time (datetime): The date and time of the appointment.
+            duration_minutes (int): The length of the appointment in minutes.
 
         Raises:
-            ValueError: If the doctor or patient is not found.
-        """
-        if doctor_id not in self.doctors:
-            logging.error("Doctor not found.")
-            raise ValueError("Doctor not found.")
-        if patient_id not in self.patients:
-            logging.error("Patient not found.")
-            raise ValueError("Patient not found.")
-        
-        doctor = self.doctors[doctor_id]
-        patient = self.patients[patient_id]
-        appointment = Appointment(appointment_id, patient, doctor, date_time)
+            ValueError: If the doctor or patient is not found, the duration is not a
+                positive integer, the appointment ID is already taken, or the doctor
+                already has an overlapping appointment.
+        """
+        doctor = self.doctors.get(doctor_id)
+        patient = self.patients.get(patient_id)
+        if doctor is None or patient is None:
+            self.flush_events()
+            logger.error("Doctor or patient not found (doctor %s, patient %s).", doctor_id, patient_id)
+            raise ValueError("Doctor or patient not found.")
+
+        if appointment_id in self.appointments:
+            self.flush_events()
+            logger.error("Appointment %s already exists.", appointment_id)
+            raise ValueError(f"Appointment {appointment_id} already exists.")
+
+        appointment = Appointment(appointment_id, patient, doctor, date_time, duration_minutes)
+        conflict = doctor.conflicts_with(appointment.date_time_ts, appointment._end_ts)
+        if conflict is not None:
+            self.flush_events()
+            logger.error("Dr. %s is not available: %s", doctor.name, conflict)
+            raise ValueError(f"Dr. {doctor.name} already has an appointment at that time.")
 
         self.appointments[appointment_id] = appointment
-        doctor.schedule.append(appointment)
+        self._appointment_list.append(appointment)
+        doctor._add_appointment(appointment)
+        self._by_doctor[doctor_id].append(appointment)
+        self._by_patient[patient_id].append(appointment)
+        index = bisect.bisect_right(self._appointment_times, appointment.date_time_ts)
+        self._appointment_times.insert(index, appointment.date_time_ts)
+        self._appointment_ids.insert(index, appointment_id)
+
+        self._record_event("Appointment booked: %s", (appointment,))
+
+    def appointments_for_doctor(self, doctor_id):
+        """
+        Returns the appointments booked with a doctor, in booking order.
+
+        Args:
+            doctor_id (int): The ID of the doctor.
+
+        Returns:
+            list: The doctor's appointments (empty if there are none).
+        """
+        return self._by_doctor.get(doctor_id, [])
+
+    def appointments_for_patient(self, patient_id):
+        """
+        Returns the appointments booked for a patient, in booking order.
+
+        Args:
+            patient_id (int): The ID of the patient.
+
+        Returns:
+            list: The patient's appointments (empty if there are none).
+        """
+        return self._by_patient.get(patient_id, [])
+
+    def average_patient_age(self):
+        """
+        Returns the mean age of all registered patients.
+
+        Returns:
+            float: The average age, or 0.0 if there are no patients.
+        """
+        if not self._patient_ages:
+            return 0.0
+        return statistics.fmean(self._patient_ages)
+
+    def patients_aged_at_least(self, min_age):
+        """
+        Returns the IDs of patients whose age is at least `min_age`.
+
+        Args:
+            min_age (int): The minimum age (inclusive).
 
-        logging.info(f"Appointment booked: {appointment}")
+        Returns:
+            list: The matching patient IDs, in registration order.
+        """
+        return [patient_id for patient_id, age in zip(self._patient_ids, self._patient_ages) if age >= min_age]
+
+    def count_appointments_between(self, start, end):
+        """
+        Counts the appointments scheduled within a time window.
+
+        Args:
+            start (datetime): The start of the window (inclusive).
+            end (datetime): The end of the window (inclusive).
+
+        Returns:
+            int: The number of appointments in the window.
+        """
+        low, high = self._time_window(start, end)
+        return high - low
+
+    def appointments_between(self, start, end):
+        """
+        Returns the appointments scheduled within a time window.
+
+        Args:
+            start (datetime): The start of the window (inclusive).
+            end (datetime): The end of the window (inclusive).
+
+        Returns:
+            list: The matching appointments, ordered by date and time.
+        """
+        low, high = self._time_window(start, end)
+        appointments = self.appointments
+        return [appointments[appointment_id] for appointment_id in self._appointment_ids[low:high]]
+
+    def _time_window(self, start, end):
+        """
+        Returns the slice bounds of the appointments between start and end (inclusive).
+        A reversed window (start after end) is empty.
+        """
+        times = self._appointment_times
+        low = bisect.bisect_left(times, to_timestamp(start))
+        high = bisect.bisect_right(times, to_timestamp(end))
+        return low, max(low, high)
+
+    def _record_event(self, message, args):
+        """Buffers a routine event, flushing once the buffer reaches max_events."""
+        if self.quiet:
+            return
+        events = self._events
+        events.append((message, args))
+        if len(events) >= self.max_events:
+            self.flush_events()
+
+    def flush_events(self):
+        """
+        Logs all buffered events as a single record and clears the buffer.
+        Also called automatically when the buffer is full, before any error
+        or warning is logged, so the log keeps events in order, and at
+        interpreter exit.
+
+        Returns:
+            list: The flushed event messages, oldest first. Empty if INFO
+            logging is disabled, in which case the events are discarded
+            without being formatted.
+        """
+        if not self._events:
+            return []
+        if not logger.isEnabledFor(logging.INFO):
+            self._events.clear()
+            return []
+        messages = [message % args for message, args in self._events]
+        self._events.clear()
+        logger.info("\n".join(messages))
+        return messages
 
     def display_patients(self):
-        """Displays all registered patients in the hospital."""
-        logging.info("Displaying all patients in the hospital.")
-        for patient in self.patients.values():
-            logging.info(patient)
+        """Displays all registered patients in the hospital as a single log record."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        lines = ["Displaying all patients in the hospital."]
+        lines.extend([patient._details for patient in self._patient_list])
+        logger.info("\n".join(lines))
 
     def display_doctors(self):
-        """Displays all registered doctors in the hospital."""
-        logging.info("Displaying all doctors in the hospital.")
-        for doctor in self.doctors.values():
-            logging.info(doctor)
+        """Displays all registered doctors in the hospital as a single log record."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        lines = ["Displaying all doctors in the hospital."]
+        lines.extend([doctor._details for doctor in self._doctor_list])
+        logger.info("\n".join(lines))
 
     def display_appointments(self):
-        """Displays all scheduled appointments in the hospital."""
-        logging.info("Displaying all appointments in the hospital.")
-        if not self.appointments:
-            logging.info("No appointments scheduled.")
+        """Displays all scheduled appointments in the hospital as a single log record."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        lines = ["Displaying all appointments in the hospital."]
+        if not self._appointment_list:
+            lines.append("No appointments scheduled.")
         else:
-            for appointment in self.appointments.values():
-                logging.info(appointment)
+            lines.extend([appointment._details for appointment in self._appointment_list])
+        logger.info("\n".join(lines))
 
     def __str__(self):
         return f"Hospital[{self.name}]: {len(self.doctors)} doctors, {len(self.patients)} patients."
@@ -312,28 +788,29 @@ class Hospital:
 
 # Main Program
 if __name__ == "__main__":
+    configure_logging()
     hospital = Hospital("City Hospital")
 
     try:
         # Add Doctors
         doctor1 = Doctor(1, "Dr. Doctor1", 45, "Cardiology")
         doctor2 = Doctor(2, "Dr. Doctor2", 50, "Neurology")
-        hospital.add_doctor(doctor1)
-        hospital.add_doctor(doctor2)
+        hospital.add_doctors([doctor1, doctor2])
 
         # Add Patients
         patient1 = Patient(101, "Patient_y", 30, "Chest Pain")
         patient2 = Patient(102, "Patient_z", 45, "Headache")
-        hospital.add_patient(patient1)
-        hospital.add_patient(patient2)
+        hospital.add_patients([patient1, patient2])
 
         # Book Appointments
         hospital.book_appointment(1, 101, 1, datetime(2024, 11, 26, 10, 0))
         hospital.book_appointment(2, 102, 2, datetime(2024, 11, 26, 14, 0))
+        hospital.flush_events()
 
         # Display Information
         hospital.display_doctors()
         hospital.display_patients()
         hospital.display_appointments()
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        hospital.flush_events()
+        logger.error("An error occurred: %s", e)
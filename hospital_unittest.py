@@ -1,10 +1,20 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import subprocess
+import sys
+import tempfile
 from abc import ABC, abstractmethod
 from datetime import datetime
 import unittest
+from unittest import mock
 
-# Configure logging to display logs on the console
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import hospital
+
+# Configure logging; INFO records are only shown on the console when HOSPITAL_QUIET=0
+quiet = os.environ.get("HOSPITAL_QUIET", "1") != "0"
+logging.basicConfig(level=logging.WARNING if quiet else logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class InvalidAgeError(Exception):
     """Custom exception to handle invalid age."""
@@ -14,7 +24,7 @@ class Person(ABC):
     """Abstract class representing a person."""
     def __init__(self, name, age):
         self.name = name
-        if not self.is_valid_age(age):
+        if type(age) is not int or age <= 0:
             raise InvalidAgeError(f"Invalid age for {name}. Age must be a positive integer.")
         self.age = age
     
@@ -26,7 +36,7 @@ class Person(ABC):
     @staticmethod
     def is_valid_age(age):
         """Static method to validate age."""
-        return isinstance(age, int) and age > 0
+        return type(age) is int and age > 0
 
 class Doctor(Person):
     """Class representing a Doctor, inheriting from Person."""
@@ -128,6 +138,7 @@ class TestHospitalSystem(unittest.TestCase):
         self.assertTrue(Person.is_valid_age(25))
         self.assertFalse(Person.is_valid_age(-3))
         self.assertFalse(Person.is_valid_age("30"))
+        self.assertFalse(Person.is_valid_age(True))
 
     def test_invalid_age_error(self):
         """Test the invalid age exception."""
@@ -174,5 +185,262 @@ class TestHospitalSystem(unittest.TestCase):
         hospital.add_patient(patient)
         hospital.add_patient(patient) 
 
+
+class TestHospitalModule(unittest.TestCase):
+    """Tests for the scheduling rules of the hospital module."""
+
+    def setUp(self):
+        self.hospital = hospital.Hospital("City Hospital", quiet=True)
+        self.hospital.add_doctor(hospital.Doctor(1, "Dr. Doctor_1", 40, "Cardiology"))
+        self.hospital.add_patient(hospital.Patient(101, "Patient_1", 30, "Flu"))
+
+    def test_invalid_duration(self):
+        """Test that zero, negative and non-integer durations are rejected."""
+        for duration in (0, -30, 15.5, True):
+            with self.assertRaises(ValueError):
+                self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 10, 0), duration)
+        self.assertEqual(len(self.hospital.appointments), 0)
+
+    def test_overlapping_appointment(self):
+        """Test that a booking overlapping an existing appointment is rejected."""
+        self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 10, 0), 30)
+        with self.assertLogs("hospital", level="ERROR"):
+            with self.assertRaises(ValueError):
+                self.hospital.book_appointment(2, 101, 1, datetime(2024, 11, 30, 10, 10), 10)
+        with self.assertLogs("hospital", level="ERROR"):
+            with self.assertRaises(ValueError):
+                self.hospital.book_appointment(3, 101, 1, datetime(2024, 11, 30, 9, 30), 31)
+
+        # Back-to-back appointments touch but do not overlap.
+        self.hospital.book_appointment(4, 101, 1, datetime(2024, 11, 30, 10, 30), 30)
+        self.hospital.book_appointment(5, 101, 1, datetime(2024, 11, 30, 9, 30), 30)
+        schedule = [appointment.appointment_id for appointment in self.hospital.doctors[1].schedule]
+        self.assertEqual(schedule, [5, 1, 4])
+
+    def test_appointment_indexes(self):
+        """Test per-doctor and per-patient lookups, including unknown IDs and rejected bookings."""
+        self.hospital.add_doctor(hospital.Doctor(2, "Dr. Doctor_2", 50, "Neurology"))
+        self.hospital.add_patient(hospital.Patient(102, "Patient_2", 45, "Migraine"))
+        self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 11, 0), 30)
+        self.hospital.book_appointment(2, 102, 1, datetime(2024, 11, 30, 10, 0), 30)
+        self.hospital.book_appointment(3, 101, 2, datetime(2024, 11, 30, 9, 0), 30)
+        with self.assertLogs("hospital", level="ERROR"):
+            with self.assertRaises(ValueError):
+                self.hospital.book_appointment(4, 102, 1, datetime(2024, 11, 30, 10, 15), 30)
+
+        def ids(appointments):
+            return [appointment.appointment_id for appointment in appointments]
+
+        # Booking order, not time order; the rejected booking 4 is in neither index.
+        self.assertEqual(ids(self.hospital.appointments_for_doctor(1)), [1, 2])
+        self.assertEqual(ids(self.hospital.appointments_for_doctor(2)), [3])
+        self.assertEqual(ids(self.hospital.appointments_for_patient(101)), [1, 3])
+        self.assertEqual(ids(self.hospital.appointments_for_patient(102)), [2])
+
+        # Unknown IDs return an empty list without adding a key to the indexes.
+        self.assertEqual(self.hospital.appointments_for_doctor(99), [])
+        self.assertEqual(self.hospital.appointments_for_patient(999), [])
+        self.assertNotIn(99, self.hospital._by_doctor)
+        self.assertNotIn(999, self.hospital._by_patient)
+
+    def test_patient_analytics(self):
+        """Test the age analytics, including the threshold edge and string IDs."""
+        self.hospital.add_patients([
+            hospital.Patient("P-1", "Patient_2", 60, "Flu"),
+            hospital.Patient(102, "Patient_3", 59, "Flu"),
+        ])
+        self.assertEqual(self.hospital.patients_aged_at_least(60), ["P-1"])
+        self.assertEqual(self.hospital.patients_aged_at_least(59), ["P-1", 102])
+        self.assertEqual(self.hospital.average_patient_age(), (30 + 60 + 59) / 3)
+
+    def test_patient_analytics_empty(self):
+        """Test the age analytics of a hospital without patients."""
+        clinic = hospital.Hospital("Clinic", quiet=True)
+        self.assertEqual(clinic.average_patient_age(), 0.0)
+        self.assertEqual(clinic.patients_aged_at_least(0), [])
+
+    def test_event_buffer(self):
+        """Test that buffered events flush when full and before errors."""
+        clinic = hospital.Hospital("Clinic", max_events=2)
+        doctor = hospital.Doctor(1, "Dr. Doctor_1", 40, "Cardiology")
+        with self.assertLogs("hospital", level="INFO") as logs:
+            clinic.add_doctor(doctor)
+            clinic.add_doctor(hospital.Doctor(2, "Dr. Doctor_2", 50, "Neurology"))
+            clinic.add_patient(hospital.Patient(101, "Patient_1", 30, "Flu"))
+            with self.assertRaises(ValueError):
+                clinic.add_doctor(doctor)
+        self.assertEqual(logs.output, [
+            "INFO:hospital:Added Doctor: Dr. Doctor_1 (Cardiology).\nAdded Doctor: Dr. Doctor_2 (Neurology).",
+            "INFO:hospital:Added Patient: Patient_1 (Ailment: Flu).",
+            "ERROR:hospital:Doctor Dr. Doctor_1 is already registered.",
+        ])
+        self.assertEqual(clinic.flush_events(), [])
+
+    def test_event_buffer_disabled_logging(self):
+        """Test that events are dropped unformatted when INFO logging is off."""
+        clinic = hospital.Hospital("Clinic")
+        clinic.add_patient(hospital.Patient(101, "Patient_1", 30, "Flu"))
+        level = hospital.logger.level
+        hospital.logger.setLevel(logging.WARNING)
+        try:
+            self.assertEqual(clinic.flush_events(), [])
+        finally:
+            hospital.logger.setLevel(level)
+        with self.assertNoLogs("hospital", level="INFO"):
+            self.assertEqual(clinic.flush_events(), [])
+
+    def test_event_buffer_flushed_at_exit(self):
+        """Test that the exit hook flushes live hospitals and skips quiet ones."""
+        clinic = hospital.Hospital("Clinic")
+        clinic.add_patient(hospital.Patient(101, "Patient_1", 30, "Flu"))
+        self.assertIn(clinic, hospital._event_buffers)
+        self.assertNotIn(self.hospital, hospital._event_buffers)
+        with self.assertLogs("hospital", level="INFO") as logs:
+            hospital._flush_event_buffers()
+        self.assertIn("INFO:hospital:Added Patient: Patient_1 (Ailment: Flu).", logs.output)
+        self.assertEqual(clinic.flush_events(), [])
+
+    def test_add_doctors_batch(self):
+        """Test that a batch add skips duplicates and reports them in one warning."""
+        clinic = hospital.Hospital("Clinic")
+        doctor = hospital.Doctor(1, "Dr. Doctor_1", 40, "Cardiology")
+        batch = [doctor, hospital.Doctor(2, "Dr. Doctor_2", 50, "Neurology"), doctor]
+        with self.assertLogs("hospital", level="INFO") as logs:
+            self.assertEqual(clinic.add_doctors(batch), 2)
+        self.assertEqual(logs.output, [
+            "INFO:hospital:Added 2 doctors: Dr. Doctor_1, Dr. Doctor_2.",
+            "WARNING:hospital:Skipped 1 already registered doctors: Dr. Doctor_1.",
+        ])
+
+        new_doctor = hospital.Doctor(3, "Dr. Doctor_3", 35, "Pediatrics")
+        batch = [hospital.Doctor(2, "Dr. Doctor_2", 50, "Neurology"), new_doctor, doctor]
+        with self.assertLogs("hospital", level="INFO") as logs:
+            self.assertEqual(clinic.add_doctors(batch), 1)
+        self.assertEqual(logs.output, [
+            "INFO:hospital:Added 1 doctors: Dr. Doctor_3.",
+            "WARNING:hospital:Skipped 2 already registered doctors: Dr. Doctor_2, Dr. Doctor_1.",
+        ])
+        self.assertEqual(list(clinic.doctors), [1, 2, 3])
+        self.assertEqual(clinic.doctors[2].specialization, "Neurology")
+
+    def test_add_patients_batch(self):
+        """Test that a batch add skips duplicates and keeps the analytics columns in step."""
+        clinic = hospital.Hospital("Clinic")
+        patient = hospital.Patient(101, "Patient_1", 30, "Flu")
+        batch = [patient, hospital.Patient(102, "Patient_2", 50, "Migraine"), patient]
+        with self.assertLogs("hospital", level="INFO") as logs:
+            self.assertEqual(clinic.add_patients(batch), 2)
+        self.assertEqual(logs.output, [
+            "INFO:hospital:Added 2 patients: Patient_1, Patient_2.",
+            "WARNING:hospital:Skipped 1 already registered patients: Patient_1.",
+        ])
+
+        batch = [hospital.Patient(102, "Patient_2", 99, "Migraine"), hospital.Patient(103, "Patient_3", 40, "Cold")]
+        with self.assertLogs("hospital", level="INFO") as logs:
+            self.assertEqual(clinic.add_patients(batch), 1)
+        self.assertEqual(logs.output, [
+            "INFO:hospital:Added 1 patients: Patient_3.",
+            "WARNING:hospital:Skipped 1 already registered patients: Patient_2.",
+        ])
+        self.assertEqual(list(clinic.patients), [101, 102, 103])
+        self.assertEqual(clinic.average_patient_age(), 40.0)
+        self.assertEqual(clinic.patients_aged_at_least(50), [102])
+
+        # A batch with nothing new records no event and logs only the warning.
+        with self.assertLogs("hospital", level="INFO") as logs:
+            self.assertEqual(clinic.add_patients([patient]), 0)
+        self.assertEqual(logs.output, ["WARNING:hospital:Skipped 1 already registered patients: Patient_1."])
+
+    def test_duplicate_appointment_id(self):
+        """Test that reusing an appointment ID is rejected before the conflict check."""
+        self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 10, 0))
+        for date_time in (datetime(2024, 11, 30, 10, 0), datetime(2024, 11, 30, 15, 0)):
+            with self.assertLogs("hospital", level="ERROR"):
+                with self.assertRaisesRegex(ValueError, "Appointment 1 already exists"):
+                    self.hospital.book_appointment(1, 101, 1, date_time)
+        self.assertEqual(len(self.hospital.appointments), 1)
+        self.assertEqual(len(self.hospital.doctors[1].schedule), 1)
+
+    def test_find_conflict(self):
+        """Test free-slot lookups in minutes, with the same duration validation as bookings."""
+        self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 10, 0), 30)
+        doctor = self.hospital.doctors[1]
+        self.assertIs(doctor.find_conflict(datetime(2024, 11, 30, 9, 45), 20), self.hospital.appointments[1])
+        self.assertIsNone(doctor.find_conflict(datetime(2024, 11, 30, 9, 30), 30))
+        self.assertIsNone(doctor.find_conflict(datetime(2024, 11, 30, 10, 30)))
+        with self.assertRaises(ValueError):
+            doctor.find_conflict(datetime(2024, 11, 30, 11, 0), 0)
+
+    def test_appointments_between(self):
+        """Test time window queries, including inclusive edges and reversed windows."""
+        self.hospital.book_appointment(1, 101, 1, datetime(2024, 11, 30, 12, 0))
+        self.hospital.book_appointment(2, 101, 1, datetime(2024, 11, 30, 10, 0))
+        self.hospital.book_appointment(3, 101, 1, datetime(2024, 11, 30, 14, 0, 0, 500))
+
+        window = self.hospital.appointments_between(datetime(2024, 11, 30, 10, 0), datetime(2024, 11, 30, 12, 0))
+        self.assertEqual([appointment.appointment_id for appointment in window], [2, 1])
+        self.assertEqual(self.hospital.count_appointments_between(datetime(2024, 11, 30, 10, 0), datetime(2024, 11, 30, 12, 0)), 2)
+
+        # Reversed windows are empty rather than negative.
+        self.assertEqual(self.hospital.appointments_between(datetime(2024, 11, 30, 13, 0), datetime(2024, 11, 30, 9, 0)), [])
+        self.assertEqual(self.hospital.count_appointments_between(datetime(2024, 11, 30, 13, 0), datetime(2024, 11, 30, 9, 0)), 0)
+
+        # Start times keep their microseconds.
+        self.assertEqual(self.hospital.count_appointments_between(datetime(2024, 11, 30, 14, 0, 0, 500), datetime(2024, 11, 30, 15, 0)), 1)
+        self.assertEqual(self.hospital.count_appointments_between(datetime(2024, 11, 30, 14, 0, 0, 501), datetime(2024, 11, 30, 15, 0)), 0)
+        self.assertEqual(self.hospital.count_appointments_between(datetime(2024, 11, 30, 13, 0), datetime(2024, 11, 30, 14, 0, 0, 499)), 0)
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Tests for the lazy logging setup of the hospital module."""
+
+    def test_import_has_no_side_effects(self):
+        """Test that importing the module opens no log file and starts no thread."""
+        code = (
+            "import os, threading\n"
+            "threads = threading.active_count()\n"
+            "import hospital\n"
+            "assert threading.active_count() == threads\n"
+            "assert hospital._log_listener is None\n"
+            "assert not os.path.exists('hospital_management.log')\n"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(hospital.__file__)))
+            result = subprocess.run([sys.executable, "-c", code], cwd=directory, env=env, capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_configure_logging_is_idempotent(self):
+        """Test that configuring twice installs a single queue handler."""
+        root_logger = logging.getLogger()
+        level = root_logger.level
+        saved = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing, logging._srcfile)
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(os.environ, HOSPITAL_QUIET="1"):
+            path = os.path.join(directory, "hospital.log")
+            hospital.configure_logging(path)
+            listener = hospital._log_listener
+            hospital.configure_logging(path)
+            queue_handlers = [handler for handler in root_logger.handlers
+                              if isinstance(handler, logging.handlers.QueueHandler)]
+            try:
+                self.assertIs(hospital._log_listener, listener)
+                self.assertEqual(len(queue_handlers), 1)
+                self.assertEqual([handler.__class__ for handler in listener.handlers], [hospital.BufferedStreamHandler])
+                hospital.logger.error("Configured.")
+            finally:
+                listener.stop()
+                atexit.unregister(listener.stop)
+                for handler in queue_handlers:
+                    root_logger.removeHandler(handler)
+                for handler in listener.handlers:
+                    atexit.unregister(handler.stream.flush)
+                    handler.close()
+                    handler.stream.close()
+                hospital._log_listener = None
+                root_logger.setLevel(level)
+                logging.logThreads, logging.logProcesses, logging.logMultiprocessing, logging._srcfile = saved
+            with open(path) as log_file:
+                self.assertTrue(log_file.read().endswith(" - ERROR - Configured.\n"))
+
 if __name__ == "__main__":
     unittest.main()